@@ -1,10 +1,12 @@
 import base64
+import urllib.parse
 import uuid
 
 from .common import InfoExtractor
 from ..networking.exceptions import HTTPError
 from ..utils import (
     ExtractorError,
+    filter_dict,
     float_or_none,
     format_field,
     int_or_none,
@@ -20,10 +22,68 @@
 )
 
 
+def _first_data(response):
+    data = response.get('data') if isinstance(response, dict) else None
+    return data[0] if isinstance(data, list) and data and isinstance(data[0], dict) else None
+
+
+def _str_or_none(value):
+    return value if isinstance(value, str) else None
+
+
+def _number(value):
+    return value if isinstance(value, int) else float_or_none(value)
+
+
+def _normalize_newlines(text):
+    return text.replace(r'\r\n', '\n') or None
+
+
+def _description(data):
+    description = data.get('description')
+    return _normalize_newlines(description) if isinstance(description, str) else None
+
+
+def _age_limit(metadata):
+    ratings = metadata.get('maturity_ratings')
+    return parse_age_limit(ratings[-1]) if isinstance(ratings, list) and ratings else None
+
+
+def _genres(data):
+    genres = data.get('genres')
+    return [
+        genre['displayValue'] for genre in (genres if isinstance(genres, list) else ())
+        if isinstance(genre, dict) and genre.get('displayValue') is not None] or None
+
+
+def _collect_thumbnails(images, thumbnails):
+    for image in images:
+        if isinstance(image, list):
+            _collect_thumbnails(image, thumbnails)
+        elif isinstance(image, dict):
+            url = url_or_none(image.get('source'))
+            if url:
+                thumbnails.append({'url': url, **filter_dict({
+                    'width': int_or_none(image.get('width')),
+                    'height': int_or_none(image.get('height')),
+                })})
+    return thumbnails
+
+
+def _extract_thumbnails(images):
+    # Maps image types to lists of image variants, which are nested one level deeper for some types
+    if isinstance(images, dict):
+        images = list(images.values())
+    if not isinstance(images, list):
+        return None
+    return _collect_thumbnails(images, []) or None
+
+
 class CrunchyrollBaseIE(InfoExtractor):
     _BASE_URL = 'https://www.crunchyroll.com'
     _API_BASE = 'https://api.crunchyroll.com'
     _NETRC_MACHINE = 'crunchyroll'
+    _AUTH_CACHE_SECTION = 'crunchyroll-auth'
     _REFRESH_TOKEN = None
     _AUTH_HEADERS = None
     _AUTH_EXPIRY = None
@@ -33,6 +93,12 @@ class CrunchyrollBaseIE(InfoExtractor):
         'yfLDfMfrYvKXh4JXS1LEI2cCqu1v5Wan',
     )).encode()).decode()
     _IS_PREMIUM = None
+    _NO_SKIP_EVENTS_IDS = set()
+    _API_CACHE = {}
+    _API_CACHE_SIZE = 512
+    _API_CACHE_TTL = 600
+    _API_CACHE_SECTION = 'crunchyroll-meta'
+    _API_DISK_CACHE_TTL = 86400
     _LOCALE_LOOKUP = {
         'ar': 'ar-SA',
         'de': 'de-DE',
@@ -51,6 +117,30 @@ def _set_auth_info(self, response):
         CrunchyrollBaseIE._IS_PREMIUM = 'cr_premium' in traverse_obj(response, ('access_token', {jwt_decode_hs256}, 'benefits', ...))
         CrunchyrollBaseIE._AUTH_HEADERS = {'Authorization': response['token_type'] + ' ' + response['access_token']}
         CrunchyrollBaseIE._AUTH_EXPIRY = time_seconds(seconds=traverse_obj(response, ('expires_in', {float_or_none}), default=300) - 10)
+        self.cache.store(self._AUTH_CACHE_SECTION, 'token', {
+            'refresh_token': CrunchyrollBaseIE._REFRESH_TOKEN,
+            'headers': CrunchyrollBaseIE._AUTH_HEADERS,
+            'expiry': CrunchyrollBaseIE._AUTH_EXPIRY,
+            'is_premium': CrunchyrollBaseIE._IS_PREMIUM,
+        })
+
+    def _load_cached_auth_info(self):
+        cached = self.cache.load(self._AUTH_CACHE_SECTION, 'token')
+        # An access token is only reusable for the same refresh token (or lack thereof)
+        if not isinstance(cached, dict) or cached.get('refresh_token') != CrunchyrollBaseIE._REFRESH_TOKEN:
+            return False
+        if not cached.get('headers') or (float_or_none(cached.get('expiry')) or 0) <= time_seconds():
+            return False
+
+        CrunchyrollBaseIE._IS_PREMIUM = cached.get('is_premium')
+        CrunchyrollBaseIE._AUTH_HEADERS = cached['headers']
+        CrunchyrollBaseIE._AUTH_EXPIRY = cached['expiry']
+        return True
+
+    def _invalidate_auth_info(self):
+        CrunchyrollBaseIE._AUTH_HEADERS = None
+        CrunchyrollBaseIE._AUTH_EXPIRY = None
+        self.cache.store(self._AUTH_CACHE_SECTION, 'token', None)
 
     def _request_token(self, headers, data, note='Requesting token', errnote='Failed to request token'):
         try:
@@ -95,6 +185,8 @@ def _perform_login(self, username, password):
     def _update_auth(self):
         if CrunchyrollBaseIE._AUTH_HEADERS and CrunchyrollBaseIE._AUTH_EXPIRY > time_seconds():
             return
+        if self._load_cached_auth_info():
+            return
 
         auth_headers = {'Authorization': self._BASIC_AUTH}
         if CrunchyrollBaseIE._REFRESH_TOKEN:
@@ -135,9 +227,14 @@ def _call_base_api(self, endpoint, internal_id, lang, note=None, query={}):
         if locale:
             query['locale'] = locale
 
-        return self._download_json(
-            f'{self._BASE_URL}{endpoint}', internal_id, note or f'Calling API: {endpoint}',
-            headers=CrunchyrollBaseIE._AUTH_HEADERS, query=query)
+        try:
+            return self._download_json(
+                f'{self._BASE_URL}{endpoint}', internal_id, note or f'Calling API: {endpoint}',
+                headers=CrunchyrollBaseIE._AUTH_HEADERS, query=query)
+        except ExtractorError as error:
+            if isinstance(error.cause, HTTPError) and error.cause.status == 401:
+                self._invalidate_auth_info()
+            raise
 
     def _call_api(self, path, internal_id, lang, note='api', query={}):
         if not path.startswith(f'/content/v2/{self._API_ENDPOINT}/'):
@@ -155,11 +252,47 @@ def _call_api(self, path, internal_id, lang, note='api', query={}):
             raise ExtractorError(f'Unexpected response when downloading {note} JSON')
         return result
 
+    def _call_api_cached(self, path, internal_id, lang, note='api', query={}):
+        # Only use this for metadata endpoints; stream links contain expiring tokens
+        if not path.startswith(f'/content/v2/{self._API_ENDPOINT}/'):
+            path = f'/content/v2/{self._API_ENDPOINT}/{path}'
+
+        locale = self._locale_from_language(lang)
+        key = (path, locale, tuple(sorted(query.items())))
+        expiry, result = CrunchyrollBaseIE._API_CACHE.pop(key, (None, None))
+        if not expiry or expiry <= time_seconds():
+            cache_key = ':'.join(filter(None, (path, locale, urllib.parse.urlencode(key[2]))))
+            cached = self.cache.load(self._API_CACHE_SECTION, cache_key)
+            if (isinstance(cached, dict) and cached.get('data')
+                    and (float_or_none(cached.get('ts')) or 0) + self._API_DISK_CACHE_TTL > time_seconds()):
+                # Callers rely on _IS_PREMIUM, which is only known once authenticated
+                self._update_auth()
+                result = cached['data']
+            else:
+                result = self._call_api(path, internal_id, lang, note, query)
+                if not result:
+                    return result
+                self.cache.store(self._API_CACHE_SECTION, cache_key, {'ts': time_seconds(), 'data': result})
+            expiry = time_seconds(seconds=self._API_CACHE_TTL)
+
+        if len(CrunchyrollBaseIE._API_CACHE) >= self._API_CACHE_SIZE:
+            del CrunchyrollBaseIE._API_CACHE[next(iter(CrunchyrollBaseIE._API_CACHE))]
+        CrunchyrollBaseIE._API_CACHE[key] = expiry, result
+        return result
+
     def _extract_chapters(self, internal_id):
-        # if no skip events are available, a 403 xml error is returned
-        skip_events = self._download_json(
-            f'https://static.crunchyroll.com/skip-events/production/{internal_id}.json',
-            internal_id, note='Downloading chapter info', fatal=False, errnote=False)
+        if internal_id in CrunchyrollBaseIE._NO_SKIP_EVENTS_IDS:
+            return None
+
+        try:
+            skip_events = self._download_json(
+                f'https://static.crunchyroll.com/skip-events/production/{internal_id}.json',
+                internal_id, note='Downloading chapter info')
+        except ExtractorError as error:
+            # if no skip events are available, a 403 xml error is returned
+            if isinstance(error.cause, HTTPError) and error.cause.status in (403, 404):
+                CrunchyrollBaseIE._NO_SKIP_EVENTS_IDS.add(internal_id)
+            return None
         if not skip_events:
             return None
 
@@ -179,14 +312,21 @@ def _extract_stream(self, identifier, display_id=None):
             display_id = identifier
 
         self._update_auth()
-        stream_response = self._download_json(
-            f'https://cr-play-service.prd.crunchyrollsvc.com/v1/{identifier}/console/switch/play',
-            display_id, note='Downloading stream info', errnote='Failed to download stream info',
-            headers=CrunchyrollBaseIE._AUTH_HEADERS)
+        try:
+            stream_response = self._download_json(
+                f'https://cr-play-service.prd.crunchyrollsvc.com/v1/{identifier}/console/switch/play',
+                display_id, note='Downloading stream info', errnote='Failed to download stream info',
+                headers=CrunchyrollBaseIE._AUTH_HEADERS)
+        except ExtractorError as error:
+            if isinstance(error.cause, HTTPError) and error.cause.status == 401:
+                self._invalidate_auth_info()
+            raise
 
         available_formats = {'': ('', '', stream_response['url'])}
-        for hardsub_lang, stream in traverse_obj(stream_response, ('hardSubs', {dict.items}, lambda _, v: v[1]['url'])):
-            available_formats[hardsub_lang] = (f'hardsub-{hardsub_lang}', hardsub_lang, stream['url'])
+        hardsubs = stream_response.get('hardSubs')
+        for hardsub_lang, stream in hardsubs.items() if isinstance(hardsubs, dict) else ():
+            if isinstance(stream, dict) and stream.get('url'):
+                available_formats[hardsub_lang] = (f'hardsub-{hardsub_lang}', hardsub_lang, stream['url'])
 
         requested_hardsubs = [('' if val == 'none' else val) for val in (self._configuration_arg('hardsub') or ['none'])]
         hardsub_langs = [lang for lang in available_formats if lang]
@@ -201,25 +341,32 @@ def _extract_stream(self, identifier, display_id=None):
         else:
             full_format_langs = set(map(str.lower, available_formats))
 
-        audio_locale = traverse_obj(stream_response, ('audioLocale', {str}))
+        audio_locale = _str_or_none(stream_response.get('audioLocale'))
         hardsub_preference = qualities(requested_hardsubs[::-1])
         formats, subtitles = [], {}
         for format_id, hardsub_lang, stream_url in available_formats.values():
-            if hardsub_lang.lower() in full_format_langs:
+            hardsub_key = hardsub_lang.lower()
+            if hardsub_key in full_format_langs:
                 adaptive_formats, dash_subs = self._extract_mpd_formats_and_subtitles(
                     stream_url, display_id, mpd_id=format_id, headers=CrunchyrollBaseIE._AUTH_HEADERS,
                     fatal=False, note=f'Downloading {f"{format_id} " if hardsub_lang else ""}MPD manifest')
                 self._merge_subtitles(dash_subs, target=subtitles)
             else:
                 continue  # XXX: Update this if/when meta mpd formats are working
+            quality = hardsub_preference(hardsub_key)
             for f in adaptive_formats:
                 if f.get('acodec') != 'none':
                     f['language'] = audio_locale
-                f['quality'] = hardsub_preference(hardsub_lang.lower())
+                f['quality'] = quality
             formats.extend(adaptive_formats)
 
-        for locale, subtitle in traverse_obj(stream_response, (('subtitles', 'captions'), {dict.items}, ...)):
-            subtitles.setdefault(locale, []).append(traverse_obj(subtitle, {'url': 'url', 'ext': 'format'}))
+        for container in (stream_response.get('subtitles'), stream_response.get('captions')):
+            for locale, subtitle in container.items() if isinstance(container, dict) else ():
+                if isinstance(subtitle, dict) and subtitle.get('url'):
+                    subtitles.setdefault(locale, []).append(filter_dict({
+                        'url': subtitle['url'],
+                        'ext': subtitle.get('format'),
+                    }))
 
         return formats, subtitles
 
@@ -366,8 +513,8 @@ def _real_extract(self, url):
         lang, internal_id = self._match_valid_url(url).group('lang', 'id')
 
         # We need to use unsigned API call to allow ratings query string
-        response = traverse_obj(self._call_api(
-            f'objects/{internal_id}', internal_id, lang, 'object info', {'ratings': 'true'}), ('data', 0, {dict}))
+        response = _first_data(self._call_api(
+            f'objects/{internal_id}', internal_id, lang, 'object info', {'ratings': 'true'}))
         if not response:
             raise ExtractorError(f'No video with id {internal_id} could be found (possibly region locked?)', expected=True)
 
@@ -419,55 +566,39 @@ def calculate_count(item):
     @staticmethod
     def _transform_episode_response(data):
         metadata = traverse_obj(data, (('episode_metadata', None), {dict}), get_all=False) or {}
-        return {
+        return filter_dict({
             'id': data['id'],
             'title': ' \u2013 '.join((
                 ('%s%s' % (
                     format_field(metadata, 'season_title'),
                     format_field(metadata, 'episode', ' Episode %s'))),
                 format_field(data, 'title'))),
-            **traverse_obj(data, {
-                'episode': ('title', {str}),
-                'description': ('description', {str}, {lambda x: x.replace(r'\r\n', '\n')}),
-                'thumbnails': ('images', 'thumbnail', ..., ..., {
-                    'url': ('source', {url_or_none}),
-                    'width': ('width', {int_or_none}),
-                    'height': ('height', {int_or_none}),
-                }),
-            }),
-            **traverse_obj(metadata, {
-                'duration': ('duration_ms', {lambda x: float_or_none(x, 1000)}),
-                'timestamp': ('upload_date', {parse_iso8601}),
-                'series': ('series_title', {str}),
-                'series_id': ('series_id', {str}),
-                'season': ('season_title', {str}),
-                'season_id': ('season_id', {str}),
-                'season_number': ('season_number', ({int}, {float_or_none})),
-                'episode_number': ('sequence_number', ({int}, {float_or_none})),
-                'age_limit': ('maturity_ratings', -1, {parse_age_limit}),
-                'language': ('audio_locale', {str}),
-            }, get_all=False),
-        }
+            'episode': _str_or_none(data.get('title')),
+            'description': _description(data),
+            'thumbnails': _extract_thumbnails(traverse_obj(data, ('images', 'thumbnail'))),
+            'duration': float_or_none(metadata.get('duration_ms'), 1000),
+            'timestamp': parse_iso8601(_str_or_none(metadata.get('upload_date'))),
+            'series': _str_or_none(metadata.get('series_title')),
+            'series_id': _str_or_none(metadata.get('series_id')),
+            'season': _str_or_none(metadata.get('season_title')),
+            'season_id': _str_or_none(metadata.get('season_id')),
+            'season_number': _number(metadata.get('season_number')),
+            'episode_number': _number(metadata.get('sequence_number')),
+            'age_limit': _age_limit(metadata),
+            'language': _str_or_none(metadata.get('audio_locale')),
+        })
 
     @staticmethod
     def _transform_movie_response(data):
         metadata = traverse_obj(data, (('movie_metadata', 'movie_listing_metadata', None), {dict}), get_all=False) or {}
-        return {
+        return filter_dict({
             'id': data['id'],
-            **traverse_obj(data, {
-                'title': ('title', {str}),
-                'description': ('description', {str}, {lambda x: x.replace(r'\r\n', '\n')}),
-                'thumbnails': ('images', 'thumbnail', ..., ..., {
-                    'url': ('source', {url_or_none}),
-                    'width': ('width', {int_or_none}),
-                    'height': ('height', {int_or_none}),
-                }),
-            }),
-            **traverse_obj(metadata, {
-                'duration': ('duration_ms', {lambda x: float_or_none(x, 1000)}),
-                'age_limit': ('maturity_ratings', -1, {parse_age_limit}),
-            }),
-        }
+            'title': _str_or_none(data.get('title')),
+            'description': _description(data),
+            'thumbnails': _extract_thumbnails(traverse_obj(data, ('images', 'thumbnail'))),
+            'duration': float_or_none(metadata.get('duration_ms'), 1000),
+            'age_limit': _age_limit(metadata),
+        })
 
 
 class CrunchyrollBetaShowIE(CrunchyrollCmsBaseIE):
@@ -505,18 +636,17 @@ def entries():
                         f'{self._BASE_URL}/{lang}watch/{episode_response["id"]}',
                         CrunchyrollBetaIE, **CrunchyrollBetaIE._transform_episode_response(episode_response))
 
-        return self.playlist_result(
-            entries(), internal_id,
-            **traverse_obj(self._call_api(f'series/{internal_id}', internal_id, lang, 'series'), ('data', 0, {
-                'title': ('title', {str}),
-                'description': ('description', {lambda x: x.replace(r'\r\n', '\n')}),
-                'age_limit': ('maturity_ratings', -1, {parse_age_limit}),
-                'thumbnails': ('images', ..., ..., ..., {
-                    'url': ('source', {url_or_none}),
-                    'width': ('width', {int_or_none}),
-                    'height': ('height', {int_or_none}),
-                })
-            })))
+        series_response = _first_data(self._call_api_cached(f'series/{internal_id}', internal_id, lang, 'series'))
+        return self.playlist_result(entries(), internal_id, **self._transform_series_response(series_response or {}))
+
+    @staticmethod
+    def _transform_series_response(data):
+        return filter_dict({
+            'title': _str_or_none(data.get('title')),
+            'description': _description(data),
+            'age_limit': _age_limit(data),
+            'thumbnails': _extract_thumbnails(data.get('images')),
+        })
 
 
 class CrunchyrollMusicIE(CrunchyrollBaseIE):
@@ -577,14 +707,15 @@ class CrunchyrollMusicIE(CrunchyrollBaseIE):
         'only_matching': True,
     }]
     _API_ENDPOINT = 'music'
+    _OBJECT_TYPE_MAP = {
+        'concert': ('concerts', 'concert info'),
+        'musicvideo': ('music_videos', 'music video info'),
+    }
 
     def _real_extract(self, url):
         lang, internal_id, object_type = self._match_valid_url(url).group('lang', 'id', 'type')
-        path, name = {
-            'concert': ('concerts', 'concert info'),
-            'musicvideo': ('music_videos', 'music video info'),
-        }[object_type]
-        response = traverse_obj(self._call_api(f'{path}/{internal_id}', internal_id, lang, name), ('data', 0, {dict}))
+        path, name = self._OBJECT_TYPE_MAP[object_type]
+        response = _first_data(self._call_api_cached(f'{path}/{internal_id}', internal_id, lang, name))
         if not response:
             raise ExtractorError(f'No video with id {internal_id} could be found (possibly region locked?)', expected=True)
 
@@ -603,23 +734,19 @@ def _real_extract(self, url):
 
     @staticmethod
     def _transform_music_response(data):
-        return {
+        artist = data.get('artist')
+        artist = artist.get('name') if isinstance(artist, dict) else None
+        return filter_dict({
             'id': data['id'],
-            **traverse_obj(data, {
-                'display_id': 'slug',
-                'title': 'title',
-                'track': 'title',
-                'artists': ('artist', 'name', all),
-                'description': ('description', {str}, {lambda x: x.replace(r'\r\n', '\n') or None}),
-                'thumbnails': ('images', ..., ..., {
-                    'url': ('source', {url_or_none}),
-                    'width': ('width', {int_or_none}),
-                    'height': ('height', {int_or_none}),
-                }),
-                'genres': ('genres', ..., 'displayValue'),
-                'age_limit': ('maturity_ratings', -1, {parse_age_limit}),
-            }),
-        }
+            'display_id': data.get('slug'),
+            'title': data.get('title'),
+            'track': data.get('title'),
+            'artists': [artist] if artist is not None else None,
+            'description': _description(data),
+            'thumbnails': _extract_thumbnails(data.get('images')),
+            'genres': _genres(data),
+            'age_limit': _age_limit(data),
+        })
 
 
 class CrunchyrollArtistIE(CrunchyrollBaseIE):
@@ -645,28 +772,21 @@ class CrunchyrollArtistIE(CrunchyrollBaseIE):
 
     def _real_extract(self, url):
         lang, internal_id = self._match_valid_url(url).group('lang', 'id')
-        response = traverse_obj(self._call_api(
-            f'artists/{internal_id}', internal_id, lang, 'artist info'), ('data', 0))
+        response = _first_data(self._call_api_cached(f'artists/{internal_id}', internal_id, lang, 'artist info'))
 
         def entries():
             for attribute, path in [('concerts', 'concert'), ('videos', 'musicvideo')]:
-                for internal_id in traverse_obj(response, (attribute, ...)):
+                for internal_id in response.get(attribute) or ():
                     yield self.url_result(f'{self._BASE_URL}/watch/{path}/{internal_id}', CrunchyrollMusicIE, internal_id)
 
         return self.playlist_result(entries(), **self._transform_artist_response(response))
 
     @staticmethod
     def _transform_artist_response(data):
-        return {
+        return filter_dict({
             'id': data['id'],
-            **traverse_obj(data, {
-                'title': 'name',
-                'description': ('description', {str}, {lambda x: x.replace(r'\r\n', '\n')}),
-                'thumbnails': ('images', ..., ..., {
-                    'url': ('source', {url_or_none}),
-                    'width': ('width', {int_or_none}),
-                    'height': ('height', {int_or_none}),
-                }),
-                'genres': ('genres', ..., 'displayValue'),
-            }),
-        }
+            'title': data.get('name'),
+            'description': _description(data),
+            'thumbnails': _extract_thumbnails(data.get('images')),
+            'genres': _genres(data),
+        })